@@ -1,11 +1,29 @@
 import datetime
+import itertools
+import sys
+import time
+from array import array
+
+
+# ==================== Saída de Mensagens ====================
+# Todas as mensagens do sistema passam por _relatar, que por padrão é o print.
+# Um script de benchmark ou outra interface pode trocá-lo com definir_relator,
+# por exemplo definir_relator(lambda *args, **kwargs: None) para silenciar a saída.
+_relatar = print
+
+def definir_relator(funcao):
+    """Define a função usada para exibir as mensagens (mesma assinatura do print)."""
+    global _relatar
+    _relatar = funcao
 
 
 class Transacao:
     """Interface para transações bancárias."""
+    __slots__ = ('_valor', '_data')
+
     def __init__(self, valor):
         self._valor = valor
-        self._data = datetime.datetime.now()
+        self._data = time.time_ns() # Instante da transação em nanossegundos (epoch)
 
     @property
     def valor(self):
@@ -15,12 +33,20 @@ class Transacao:
     def data(self):
         return self._data
 
+    @property
+    def data_hora(self):
+        """Instante da transação como datetime, construído apenas quando necessário."""
+        return datetime.datetime.fromtimestamp(self._data / 1e9)
+
     def registrar(self, conta):
         """Método abstrato para registrar a transação na conta."""
         raise NotImplementedError("Método registrar deve ser implementado pela subclasse.")
 
 class Deposito(Transacao):
     """Representa uma transação de depósito."""
+    __slots__ = ()
+    _TIPO = "Deposito" # Nome do tipo gravado no histórico
+
     def __init__(self, valor):
         super().__init__(valor)
 
@@ -33,6 +59,9 @@ class Deposito(Transacao):
 
 class Saque(Transacao):
     """Representa uma transação de saque."""
+    __slots__ = ()
+    _TIPO = "Saque" # Nome do tipo gravado no histórico
+
     def __init__(self, valor):
         super().__init__(valor)
 
@@ -45,26 +74,36 @@ class Saque(Transacao):
 
 # ==================== Classe Historico ====================
 class Historico:
+    __slots__ = ('_tipos', '_valores', '_datas')
+
     def __init__(self):
-        self._transacoes = []
+        # Colunas paralelas (tipo, valor, data) em vez de um dicionário por transação
+        self._tipos = []
+        self._valores = array("d")
+        self._datas = array("q") # Timestamps em nanossegundos
+
+    def __len__(self):
+        return len(self._valores)
 
     @property
     def transacoes(self):
-        return self._transacoes
+        """Itera sobre as transações como tuplas (tipo, valor, data)."""
+        return zip(self._tipos, self._valores, self._datas)
 
     def adicionar_transacao(self, transacao):
-        self._transacoes.append({
-            "tipo": transacao.__class__.__name__,
-            "valor": transacao.valor,
-            "data": transacao.data.strftime("%d-%m-%Y %H:%M:%S"),
-        })
+        self._tipos.append(transacao._TIPO)
+        self._valores.append(transacao.valor)
+        self._datas.append(transacao.data) # Formatada apenas na exibição do extrato
 
 # ==================== Classe Conta ====================
 class Conta:
+    __slots__ = ('_saldo', '_numero', '_cliente', '_historico')
+
+    _agencia = "0001" # Agência fixa conforme padrão comum, compartilhada por todas as contas
+
     def __init__(self, numero, cliente):
         self._saldo = 0.0
         self._numero = numero
-        self._agencia = "0001" # Agência fixa conforme padrão comum
         self._cliente = cliente
         self._historico = Historico()
 
@@ -94,27 +133,29 @@ class Conta:
 
     def sacar(self, valor):
         if valor <= 0:
-            print("\n@@@ Operação falhou! O valor informado é inválido. @@@")
+            _relatar("\n@@@ Operação falhou! O valor informado é inválido. @@@")
             return False
         if valor > self._saldo:
-            print("\n@@@ Operação falhou! Você não tem saldo suficiente. @@@")
+            _relatar("\n@@@ Operação falhou! Você não tem saldo suficiente. @@@")
             return False
 
         self._saldo -= valor
-        print("\n=== Saque realizado com sucesso! ===")
+        _relatar("\n=== Saque realizado com sucesso! ===")
         return True
 
     def depositar(self, valor):
         if valor <= 0:
-            print("\n@@@ Operação falhou! O valor informado é inválido. @@@")
+            _relatar("\n@@@ Operação falhou! O valor informado é inválido. @@@")
             return False
 
         self._saldo += valor
-        print("\n=== Depósito realizado com sucesso! ===")
+        _relatar("\n=== Depósito realizado com sucesso! ===")
         return True
 
 # ==================== Classe ContaCorrente ====================
 class ContaCorrente(Conta):
+    __slots__ = ('_limite', '_limite_saques', '_numero_saques')
+
     def __init__(self, numero, cliente, limite=500.0, limite_saques=3):
         super().__init__(numero, cliente)
         self._limite = limite
@@ -134,10 +175,10 @@ class ContaCorrente(Conta):
         excedeu_saques = self._numero_saques >= self._limite_saques
 
         if excedeu_limite:
-            print("\n@@@ Operação falhou! O valor do saque excede o limite. @@@")
+            _relatar("\n@@@ Operação falhou! O valor do saque excede o limite. @@@")
             return False
         elif excedeu_saques:
-            print("\n@@@ Operação falhou! Número máximo de saques excedido. @@@")
+            _relatar("\n@@@ Operação falhou! Número máximo de saques excedido. @@@")
             return False
         else:
             if super().sacar(valor): # Chama o sacar da classe base
@@ -154,9 +195,12 @@ class ContaCorrente(Conta):
 
 # ==================== Classe Cliente ====================
 class Cliente:
+    __slots__ = ('_endereco', '_contas', '_conta_primaria')
+
     def __init__(self, endereco):
         self._endereco = endereco
         self._contas = []
+        self._conta_primaria = None # Primeira conta adicionada, usada nas operações
 
     @property
     def endereco(self):
@@ -166,29 +210,35 @@ class Cliente:
     def contas(self):
         return self._contas
 
+    @property
+    def conta_primaria(self):
+        return self._conta_primaria
+
     def realizar_transacao(self, conta, transacao):
         """
         Realiza uma transação (Depósito ou Saque) na conta do cliente.
         """
-        if isinstance(transacao, Transacao):
-            if transacao.registrar(conta):
-                print(f"\nOperação de {transacao.__class__.__name__} realizada com sucesso!")
-            else:
-                print(f"\nFalha ao realizar a operação de {transacao.__class__.__name__}.")
+        # Despacho direto: depositar/sacar só constroem Deposito ou Saque.
+        if transacao.registrar(conta):
+            _relatar(f"\nOperação de {transacao._TIPO} realizada com sucesso!")
         else:
-            print("\nTransação inválida. Deve ser uma instância de Deposito ou Saque.")
+            _relatar(f"\nFalha ao realizar a operação de {transacao._TIPO}.")
 
     def adicionar_conta(self, conta):
         """Adiciona uma conta à lista de contas do cliente."""
+        if self._conta_primaria is None:
+            self._conta_primaria = conta
         self._contas.append(conta)
 
 
 class PessoaFisica(Cliente):
+    __slots__ = ('_nome', '_data_nascimento', '_cpf')
+
     def __init__(self, nome, data_nascimento, cpf, endereco):
         super().__init__(endereco)
         self._nome = nome
         self._data_nascimento = data_nascimento
-        self._cpf = cpf 
+        self._cpf = sys.intern(cpf) # String única por CPF: comparações caem no atalho por identidade
 
     @property
     def nome(self):
@@ -211,8 +261,7 @@ class PessoaFisica(Cliente):
 
 # ==================== Funções de Menu Adaptadas para Classes ====================
 
-def menu():
-    menu_str = """\n
+_MENU = """\n
     =========== MENU ===========
     [d]\tDepositar
     [s]\tSacar
@@ -222,54 +271,111 @@ def menu():
     [lc]\tListar contas
     [q]\tSair
     => """
-    return input(menu_str)
+
+_SEPARADOR = "=" * 100
+_LINHA_EXTRATO = "%s:\tR$ %.2f (%s)"
+_FORMATO_DATA = "%d-%m-%Y %H:%M:%S"
+
+def menu():
+    return input(_MENU)
 
 def filtrar_cliente(cpf, clientes):
-    clientes_filtrados = [cliente for cliente in clientes if cliente.cpf == cpf]
-    return clientes_filtrados[0] if clientes_filtrados else None
+    # clientes é um dicionário indexado por CPF: busca direta, sem percorrer a lista.
+    return clientes.get(cpf)
 
 def recuperar_conta_cliente(cliente):
-    if not cliente.contas:
-        print("\n@@@ Cliente não possui conta. @@@")
+    conta = cliente.conta_primaria
+    if conta is None:
+        _relatar("\n@@@ Cliente não possui conta. @@@")
         return None
 
     # Implementação simplificada: escolhe a primeira conta.
     # Em um sistema real, haveria uma seleção de contas se o cliente tiver múltiplas.
-    return cliente.contas[0]
+    return conta
 
-def depositar(clientes):
-    cpf = input("Informe o CPF do cliente: ")
-    cliente = filtrar_cliente(cpf, clientes)
+# Funções executar_*: recebem os dados já informados, sem input(), e são
+# usadas tanto pelo menu interativo quanto por executar_lote.
 
-    if not cliente:
-        print("\n@@@ Cliente não encontrado! @@@")
+def executar_deposito(cliente, valor):
+    conta = recuperar_conta_cliente(cliente)
+    if not conta:
         return
 
-    valor = float(input("Informe o valor do depósito: "))
-    transacao = Deposito(valor)
+    cliente.realizar_transacao(conta, Deposito(valor))
 
+def executar_saque(cliente, valor):
     conta = recuperar_conta_cliente(cliente)
     if not conta:
         return
 
-    cliente.realizar_transacao(conta, transacao)
+    cliente.realizar_transacao(conta, Saque(valor))
 
-def sacar(clientes):
+def executar_extrato(cliente):
+    conta = recuperar_conta_cliente(cliente)
+    if not conta:
+        return
+
+    # Monta o extrato inteiro e escreve de uma só vez
+    linhas = ["\n================ EXTRATO ================"]
+    historico = conta.historico
+
+    if not historico:
+        linhas.append("Não foram realizadas movimentações.")
+    else:
+        for tipo, valor, data in historico.transacoes:
+            linhas.append(_LINHA_EXTRATO % (tipo, valor, datetime.datetime.fromtimestamp(data / 1e9).strftime(_FORMATO_DATA)))
+
+    linhas.append(f"\nSaldo:\t\tR$ {conta.saldo:.2f}")
+    linhas.append("==========================================\n")
+    _relatar("\n".join(linhas), end="")
+
+def executar_criacao_usuario(clientes, cpf, nome, data_nascimento, endereco):
+    if filtrar_cliente(cpf, clientes):
+        _relatar("\n@@@ Já existe cliente com este CPF! @@@")
+        return
+
+    try:
+        # Tenta converter a data para um objeto datetime para validação básica
+        datetime.datetime.strptime(data_nascimento, "%d-%m-%Y")
+    except ValueError:
+        _relatar("\n@@@ Formato de data inválido. Use dd-mm-aaaa. @@@")
+        return
+
+    cliente = PessoaFisica(nome=nome, data_nascimento=data_nascimento, cpf=cpf, endereco=endereco)
+    clientes[cliente.cpf] = cliente
+
+    _relatar("\n=== Cliente criado com sucesso! ===")
+
+def executar_criacao_conta(numeros_conta, cliente, contas):
+    # O número só é consumido quando a conta é de fato criada, sem deixar lacunas.
+    numero_conta = next(numeros_conta)
+    conta = ContaCorrente.nova_conta(cliente=cliente, numero=numero_conta)
+    contas.append(conta)
+    cliente.adicionar_conta(conta)
+
+    _relatar("\n=== Conta criada com sucesso! ===")
+
+def depositar(clientes):
     cpf = input("Informe o CPF do cliente: ")
     cliente = filtrar_cliente(cpf, clientes)
 
     if not cliente:
-        print("\n@@@ Cliente não encontrado! @@@")
+        _relatar("\n@@@ Cliente não encontrado! @@@")
         return
 
-    valor = float(input("Informe o valor do saque: "))
-    transacao = Saque(valor)
+    valor = float(input("Informe o valor do depósito: "))
+    executar_deposito(cliente, valor)
 
-    conta = recuperar_conta_cliente(cliente)
-    if not conta:
+def sacar(clientes):
+    cpf = input("Informe o CPF do cliente: ")
+    cliente = filtrar_cliente(cpf, clientes)
+
+    if not cliente:
+        _relatar("\n@@@ Cliente não encontrado! @@@")
         return
 
-    cliente.realizar_transacao(conta, transacao)
+    valor = float(input("Informe o valor do saque: "))
+    executar_saque(cliente, valor)
 
 
 def exibir_extrato(clientes):
@@ -277,24 +383,10 @@ def exibir_extrato(clientes):
     cliente = filtrar_cliente(cpf, clientes)
 
     if not cliente:
-        print("\n@@@ Cliente não encontrado! @@@")
-        return
-
-    conta = recuperar_conta_cliente(cliente)
-    if not conta:
+        _relatar("\n@@@ Cliente não encontrado! @@@")
         return
 
-    print("\n================ EXTRATO ================")
-    transacoes = conta.historico.transacoes
-
-    if not transacoes:
-        print("Não foram realizadas movimentações.")
-    else:
-        for transacao in transacoes:
-            print(f"{transacao['tipo']}:\tR$ {transacao['valor']:.2f} ({transacao['data']})")
-
-    print(f"\nSaldo:\t\tR$ {conta.saldo:.2f}")
-    print("==========================================")
+    executar_extrato(cliente)
 
 
 def criar_usuario(clientes):
@@ -302,85 +394,112 @@ def criar_usuario(clientes):
     cliente = filtrar_cliente(cpf, clientes)
 
     if cliente:
-        print("\n@@@ Já existe cliente com este CPF! @@@")
+        _relatar("\n@@@ Já existe cliente com este CPF! @@@")
         return
 
     nome = input("Informe o nome completo: ")
     data_nascimento = input("Informe a data de nascimento (dd-mm-aaaa): ")
     endereco = input("Informe o endereço (logradouro, nro - bairro - cidade/sigla estado): ")
 
-    try:
-        # Tenta converter a data para um objeto datetime para validação básica
-        datetime.datetime.strptime(data_nascimento, "%d-%m-%Y")
-    except ValueError:
-        print("\n@@@ Formato de data inválido. Use dd-mm-aaaa. @@@")
-        return
-
-    cliente = PessoaFisica(nome=nome, data_nascimento=data_nascimento, cpf=cpf, endereco=endereco)
-    clientes.append(cliente)
-
-    print("\n=== Cliente criado com sucesso! ===")
+    executar_criacao_usuario(clientes, cpf, nome, data_nascimento, endereco)
 
 
-def criar_conta(numero_conta, clientes, contas):
+def criar_conta(numeros_conta, clientes, contas):
     cpf = input("Informe o CPF do cliente: ")
     cliente = filtrar_cliente(cpf, clientes)
 
     if not cliente:
-        print("\n@@@ Cliente não encontrado, fluxo de criação de conta encerrado! @@@")
-        return
-
-    conta = ContaCorrente.nova_conta(cliente=cliente, numero=numero_conta)
-    contas.append(conta)
-    cliente.adicionar_conta(conta)
+        _relatar("\n@@@ Cliente não encontrado, fluxo de criação de conta encerrado! @@@")
+        return False
 
-    print("\n=== Conta criada com sucesso! ===")
+    executar_criacao_conta(numeros_conta, cliente, contas)
+    return True
 
 
 def listar_contas(contas):
     if not contas:
-        print("\n@@@ Nenhuma conta cadastrada. @@@")
+        _relatar("\n@@@ Nenhuma conta cadastrada. @@@")
         return
 
+    # Monta a listagem inteira e escreve de uma só vez
+    partes = []
     for conta in contas:
-        print("=" * 100)
-        print(str(conta)) # Chama o método __str__ da ContaCorrente
-    print("=" * 100)
-
-
-# ==================== Função Principal ====================
-def main():
-    clientes = []
+        partes.append(_SEPARADOR)
+        partes.append(str(conta)) # Chama o método __str__ da ContaCorrente
+    partes.append(_SEPARADOR + "\n")
+    _relatar("\n".join(partes), end="")
+
+
+# ==================== Execução em Lote ====================
+def executar_lote(eventos):
+    """
+    Executa uma sequência de operações sem interação com o usuário, útil para
+    reproduzir cenários e medir desempenho. Cada evento é uma tupla
+    (opcao, *argumentos), com as mesmas opções do menu:
+
+        ("nc", cpf, nome, data_nascimento, endereco)
+        ("nu", cpf)
+        ("d", cpf, valor) / ("s", cpf, valor)
+        ("e", cpf)
+        ("lc",)
+
+    Retorna os clientes (CPF -> Cliente) e as contas criadas.
+    """
+    clientes = {} # CPF -> Cliente
     contas = []
-    numero_conta = 1
+    numeros_conta = itertools.count(1)
 
-    while True:
-        opcao = menu()
+    def com_cliente(executar):
+        # Resolve o CPF do evento para o cliente antes de chamar a operação
+        def operacao(cpf, *argumentos):
+            cliente = filtrar_cliente(cpf, clientes)
+            if not cliente:
+                _relatar("\n@@@ Cliente não encontrado! @@@")
+                return
+            executar(cliente, *argumentos)
+        return operacao
 
-        if opcao == "d":
-            depositar(clientes)
+    operacoes = {
+        "d": com_cliente(executar_deposito),
+        "s": com_cliente(executar_saque),
+        "e": com_cliente(executar_extrato),
+        "nc": lambda *argumentos: executar_criacao_usuario(clientes, *argumentos),
+        "nu": com_cliente(lambda cliente: executar_criacao_conta(numeros_conta, cliente, contas)),
+        "lc": lambda: listar_contas(contas),
+    }
 
-        elif opcao == "s":
-            sacar(clientes)
+    for opcao, *argumentos in eventos:
+        operacoes[opcao](*argumentos)
 
-        elif opcao == "e":
-            exibir_extrato(clientes)
+    return clientes, contas
 
-        elif opcao == "nc":
-            criar_usuario(clientes)
 
-        elif opcao == "nu":
-            criar_conta(numero_conta, clientes, contas)
-            numero_conta += 1
+# ==================== Função Principal ====================
+def main():
+    clientes = {} # CPF -> Cliente
+    contas = []
+    numeros_conta = itertools.count(1)
 
-        elif opcao == "lc":
-            listar_contas(contas)
+    operacoes = {
+        "d": lambda: depositar(clientes),
+        "s": lambda: sacar(clientes),
+        "e": lambda: exibir_extrato(clientes),
+        "nc": lambda: criar_usuario(clientes),
+        "nu": lambda: criar_conta(numeros_conta, clientes, contas),
+        "lc": lambda: listar_contas(contas),
+    }
+
+    while True:
+        opcao = menu()
 
-        elif opcao == "q":
+        if opcao == "q":
             break
 
+        operacao = operacoes.get(opcao)
+        if operacao:
+            operacao()
         else:
-            print("\n@@@ Operação inválida, por favor selecione novamente a operação desejada. @@@")
+            _relatar("\n@@@ Operação inválida, por favor selecione novamente a operação desejada. @@@")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
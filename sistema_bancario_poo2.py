@@ -1,47 +1,72 @@
 import datetime
+import itertools
+import sys
+import time
 from abc import ABC, abstractmethod
+from array import array
+from operator import mul
+
+# ==================== Saída de Mensagens ====================
+# Todas as mensagens do sistema passam por _relatar, que por padrão é o print.
+# Um script de benchmark ou outra interface pode trocá-lo com definir_relator,
+# por exemplo definir_relator(lambda *args, **kwargs: None) para silenciar a saída.
+_relatar = print
+
+def definir_relator(funcao):
+    """Define a função usada para exibir as mensagens (mesma assinatura do print)."""
+    global _relatar
+    _relatar = funcao
 
 # ==================== Funções Auxiliares de Validação ====================
+# Tabelas para bytes.translate: descarta tudo que não é dígito ASCII e
+# converte b"0".."9" nos valores 0..9
+_NAO_DIGITOS = bytes(c for c in range(256) if not 48 <= c <= 57)
+_ASCII_PARA_DIGITO = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+# Pesos dos dígitos verificadores (10..2 para o primeiro, 11..2 para o segundo)
+_PESOS_DIGITO1 = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+_PESOS_DIGITO2 = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+
+def _cpf_core(digitos):
+    """
+    Núcleo aritmético da validação: recebe os 11 dígitos já convertidos
+    (sequência de valores 0..9) e confere os dois dígitos verificadores.
+    """
+    # Somas ponderadas feitas em C (map + sum), sem laço interpretado
+    resto1 = sum(map(mul, digitos, _PESOS_DIGITO1)) % 11
+    resto2 = sum(map(mul, digitos, _PESOS_DIGITO2)) % 11
+
+    # digito = 0 se resto < 2, senão 11 - resto (sem desvio condicional)
+    digito1 = (11 - resto1) * (resto1 >= 2)
+    digito2 = (11 - resto2) * (resto2 >= 2)
+    return digito1 == digitos[9] and digito2 == digitos[10]
+
 def validar_cpf(cpf):
     """
     Valida um número de CPF brasileiro.
     Retorna True se o CPF for válido, False caso contrário.
     """
-    cpf = ''.join(filter(str.isdigit, cpf)) # Remove caracteres não numéricos
+    # Remove caracteres não numéricos (somente dígitos ASCII são considerados)
+    cpf = cpf.encode("ascii", "ignore").translate(None, _NAO_DIGITOS)
 
     if len(cpf) != 11:
         return False
 
     # Verifica se todos os dígitos são iguais (ex: 111.111.111-11)
-    if cpf == cpf[0] * 11:
+    if cpf == cpf[:1] * 11:
         return False
 
-    # Validação do primeiro dígito verificador
-    soma = 0
-    for i in range(9):
-        soma += int(cpf[i]) * (10 - i)
-    resto = soma % 11
-    digito1 = 0 if resto < 2 else 11 - resto
-    if digito1 != int(cpf[9]):
-        return False
-
-    # Validação do segundo dígito verificador
-    soma = 0
-    for i in range(10):
-        soma += int(cpf[i]) * (11 - i)
-    resto = soma % 11
-    digito2 = 0 if resto < 2 else 11 - resto
-    if digito2 != int(cpf[10]):
-        return False
-
-    return True
+    # Converte b"0".."9" para os valores 0..9; indexar bytes já devolve int
+    return _cpf_core(cpf.translate(_ASCII_PARA_DIGITO))
 
 # ==================== Classe Transacao (Abstrata) ====================
 class Transacao(ABC):
     """Interface abstrata para transações bancárias."""
+    __slots__ = ('_valor', '_data')
+
     def __init__(self, valor):
         self._valor = valor
-        self._data = datetime.datetime.now()
+        self._data = time.time_ns() # Instante da transação em nanossegundos (epoch)
 
     @property
     def valor(self):
@@ -51,6 +76,11 @@ class Transacao(ABC):
     def data(self):
         return self._data
 
+    @property
+    def data_hora(self):
+        """Instante da transação como datetime, construído apenas quando necessário."""
+        return datetime.datetime.fromtimestamp(self._data / 1e9)
+
     @abstractmethod
     def registrar(self, conta):
         """Método abstrato para registrar a transação na conta."""
@@ -58,44 +88,60 @@ class Transacao(ABC):
 
 class Deposito(Transacao):
     """Representa uma transação de depósito."""
+    __slots__ = ()
+    _TIPO = "Deposito" # Nome do tipo gravado no histórico
+
     def __init__(self, valor):
         super().__init__(valor)
 
     def registrar(self, conta):
         """Registra o depósito na conta."""
-        return conta.depositar(self.valor) # A lógica de adicionar ao histórico é movida para o depositar da Conta
+        return conta._registrar_deposito(self) # A própria transação é gravada no histórico da Conta
 
 class Saque(Transacao):
     """Representa uma transação de saque."""
+    __slots__ = ()
+    _TIPO = "Saque" # Nome do tipo gravado no histórico
+
     def __init__(self, valor):
         super().__init__(valor)
 
     def registrar(self, conta):
         """Registra o saque na conta."""
-        return conta.sacar(self.valor) # A lógica de adicionar ao histórico é movida para o sacar da Conta
+        return conta._registrar_saque(self) # A própria transação é gravada no histórico da Conta
 
 # ==================== Classe Historico ====================
 class Historico:
+    __slots__ = ('_tipos', '_valores', '_datas')
+
     def __init__(self):
-        self._transacoes = []
+        # Colunas paralelas (tipo, valor, data) em vez de um dicionário por transação
+        self._tipos = []
+        self._valores = array("d")
+        self._datas = array("q") # Timestamps em nanossegundos
+
+    def __len__(self):
+        return len(self._valores)
 
     @property
     def transacoes(self):
-        return self._transacoes
+        """Itera sobre as transações como tuplas (tipo, valor, data)."""
+        return zip(self._tipos, self._valores, self._datas)
 
     def adicionar_transacao(self, transacao):
-        self._transacoes.append({
-            "tipo": transacao.__class__.__name__,
-            "valor": transacao.valor,
-            "data": transacao.data.strftime("%d-%m-%Y %H:%M:%S"),
-        })
+        self._tipos.append(transacao._TIPO)
+        self._valores.append(transacao.valor)
+        self._datas.append(transacao.data) # Formatada apenas na exibição do extrato
 
 # ==================== Classe Conta ====================
 class Conta:
+    __slots__ = ('_saldo', '_numero', '_cliente', '_historico')
+
+    _agencia = "0001" # Agência fixa conforme padrão comum, compartilhada por todas as contas
+
     def __init__(self, numero, cliente):
         self._saldo = 0.0
         self._numero = numero
-        self._agencia = "0001" # Agência fixa conforme padrão comum
         self._cliente = cliente
         self._historico = Historico()
 
@@ -124,28 +170,40 @@ class Conta:
         return self._historico
 
     def sacar(self, valor):
+        return self._registrar_saque(Saque(valor))
+
+    def depositar(self, valor):
+        return self._registrar_deposito(Deposito(valor))
+
+    def _registrar_saque(self, transacao):
+        """Aplica um Saque já construído e o grava no histórico, sem recriá-lo."""
+        valor = transacao.valor
         if valor <= 0:
-            print("\n@@@ Erro no saque: O valor informado é inválido (deve ser positivo). @@@") # Adicionado aqui para clareza
+            _relatar("\n@@@ Erro no saque: O valor informado é inválido (deve ser positivo). @@@") # Adicionado aqui para clareza
             return False
         if valor > self._saldo:
-            print("\n@@@ Erro no saque: Você não tem saldo suficiente. @@@") # Adicionado aqui para clareza
+            _relatar("\n@@@ Erro no saque: Você não tem saldo suficiente. @@@") # Adicionado aqui para clareza
             return False
 
         self._saldo -= valor
-        self.historico.adicionar_transacao(Saque(valor)) # Adiciona ao histórico
+        self._historico.adicionar_transacao(transacao) # Adiciona ao histórico
         return True
 
-    def depositar(self, valor):
+    def _registrar_deposito(self, transacao):
+        """Aplica um Deposito já construído e o grava no histórico, sem recriá-lo."""
+        valor = transacao.valor
         if valor <= 0:
-            print("\n@@@ Erro no depósito: O valor informado é inválido (deve ser positivo). @@@") # Adicionado aqui para clareza
+            _relatar("\n@@@ Erro no depósito: O valor informado é inválido (deve ser positivo). @@@") # Adicionado aqui para clareza
             return False
 
         self._saldo += valor
-        self.historico.adicionar_transacao(Deposito(valor)) # Adiciona ao histórico
+        self._historico.adicionar_transacao(transacao) # Adiciona ao histórico
         return True
 
 # ==================== Classe ContaCorrente ====================
 class ContaCorrente(Conta):
+    __slots__ = ('_limite', '_limite_saques', '_numero_saques')
+
     def __init__(self, numero, cliente, limite=500.0, limite_saques=3):
         super().__init__(numero, cliente)
         self._limite = limite
@@ -160,20 +218,21 @@ class ContaCorrente(Conta):
     def limite_saques(self):
         return self._limite_saques
 
-    def sacar(self, valor):
+    def _registrar_saque(self, transacao):
+        valor = transacao.valor
         excedeu_limite = valor > self._limite
         excedeu_saques = self._numero_saques >= self._limite_saques
 
         if excedeu_limite:
-            print("\n@@@ Erro no saque: O valor do saque excede o limite. @@@") # Adicionado aqui para clareza
+            _relatar("\n@@@ Erro no saque: O valor do saque excede o limite. @@@") # Adicionado aqui para clareza
             return False
         elif excedeu_saques:
-            print("\n@@@ Erro no saque: Número máximo de saques diários excedido. @@@") # Adicionado aqui para clareza
+            _relatar("\n@@@ Erro no saque: Número máximo de saques diários excedido. @@@") # Adicionado aqui para clareza
             return False
         else:
             # Chama o sacar da classe base. Se a classe base retornar False (e.g., saldo insuficiente ou valor inválido),
             # a mensagem já foi impressa pela base.
-            if super().sacar(valor):
+            if super()._registrar_saque(transacao):
                 self._numero_saques += 1
                 return True
             return False # Saque falhou na classe base (saldo insuficiente ou valor inválido)
@@ -190,9 +249,12 @@ class ContaCorrente(Conta):
 
 # ==================== Classe Cliente ====================
 class Cliente:
+    __slots__ = ('_endereco', '_contas', '_conta_primaria')
+
     def __init__(self, endereco):
         self._endereco = endereco
         self._contas = []
+        self._conta_primaria = None # Primeira conta adicionada, usada nas operações
 
     @property
     def endereco(self):
@@ -202,6 +264,10 @@ class Cliente:
     def contas(self):
         return self._contas
 
+    @property
+    def conta_primaria(self):
+        return self._conta_primaria
+
     def realizar_transacao(self, conta, transacao):
         """
         Realiza uma transação (Depósito ou Saque) na conta do cliente.
@@ -209,22 +275,24 @@ class Cliente:
         As mensagens de erro específicas da transação são agora gerenciadas
         pela lógica dentro dos métodos de sacar/depositar da conta.
         """
-        if not isinstance(transacao, Transacao):
-            print("\n@@@ Erro: Transação inválida. Deve ser uma instância de Deposito ou Saque. @@@")
-            return False
+        # Despacho direto: depositar/sacar só constroem Deposito ou Saque.
         return transacao.registrar(conta)
 
     def adicionar_conta(self, conta):
         """Adiciona uma conta à lista de contas do cliente."""
+        if self._conta_primaria is None:
+            self._conta_primaria = conta
         self._contas.append(conta)
 
 # ==================== Classe PessoaFisica ====================
 class PessoaFisica(Cliente):
+    __slots__ = ('_nome', '_data_nascimento', '_cpf')
+
     def __init__(self, nome, data_nascimento, cpf, endereco):
         super().__init__(endereco)
         self._nome = nome
         self._data_nascimento = data_nascimento
-        self._cpf = cpf
+        self._cpf = sys.intern(cpf) # String única por CPF: comparações caem no atalho por identidade
 
     @property
     def nome(self):
@@ -248,8 +316,7 @@ class PessoaFisica(Cliente):
 
 # ==================== Funções de Menu e Interação com o Usuário ====================
 
-def menu():
-    menu_str = """\n
+_MENU = """\n
     =========== MENU ===========
     [d]\tDepositar
     [s]\tSacar
@@ -259,47 +326,143 @@ def menu():
     [lc]\tListar contas
     [q]\tSair
     => """
-    return input(menu_str)
+
+_SEPARADOR = "=" * 100
+_LINHA_EXTRATO = "%s:\tR$ %.2f (%s)"
+_FORMATO_DATA = "%d-%m-%Y %H:%M:%S"
+
+def menu():
+    return input(_MENU)
 
 def filtrar_cliente(cpf, clientes):
-    clientes_filtrados = [cliente for cliente in clientes if cliente.cpf == cpf]
-    return clientes_filtrados[0] if clientes_filtrados else None
+    # clientes é um dicionário indexado por CPF: busca direta, sem percorrer a lista.
+    return clientes.get(cpf)
 
 def recuperar_conta_cliente(cliente):
-    if not cliente.contas:
-        print("\n@@@ Cliente não possui conta. @@@")
+    conta = cliente.conta_primaria
+    if conta is None:
+        _relatar("\n@@@ Cliente não possui conta. @@@")
         return None
 
     # FUTURO: Se o cliente tiver múltiplas contas, implementar lógica de seleção aqui.
     # Ex: pedir ao usuário para escolher a conta pelo número.
     # Por enquanto, retorna a primeira conta encontrada.
-    print(f"\nSelecionando a primeira conta do cliente {cliente.nome} (número {cliente.contas[0].numero}).")
-    return cliente.contas[0]
+    _relatar(f"\nSelecionando a primeira conta do cliente {cliente.nome} (número {conta.numero}).")
+    return conta
+
+# Funções executar_*: recebem os dados já informados, sem input(), e são
+# usadas tanto pelo menu interativo quanto por executar_lote.
+# Retornam True se a operação for bem-sucedida, False caso contrário.
+
+def executar_deposito(cliente, valor):
+    conta = recuperar_conta_cliente(cliente)
+    if not conta:
+        return False # Mensagem já tratada em recuperar_conta_cliente
+
+    if cliente.realizar_transacao(conta, Deposito(valor)):
+        _relatar("\n=== Depósito realizado com sucesso! ===")
+        return True
+    # As mensagens de erro para valor <= 0 já estão dentro de Conta.depositar
+    return False
+
+
+def executar_saque(cliente, valor):
+    conta = recuperar_conta_cliente(cliente)
+    if not conta:
+        return False # Mensagem já tratada em recuperar_conta_cliente
+
+    if cliente.realizar_transacao(conta, Saque(valor)):
+        _relatar("\n=== Saque realizado com sucesso! ===")
+        return True
+    # As mensagens de erro para saldo insuficiente, limite e saques excedidos
+    # já são tratadas dentro de Conta.sacar e ContaCorrente.sacar.
+    return False
+
+
+def executar_extrato(cliente):
+    conta = recuperar_conta_cliente(cliente)
+    if not conta:
+        return False # Mensagem já tratada em recuperar_conta_cliente
+
+    # Monta o extrato inteiro e escreve de uma só vez
+    linhas = ["\n================ EXTRATO ================"]
+    historico = conta.historico
+
+    if not historico:
+        linhas.append("Não foram realizadas movimentações.")
+    else:
+        for tipo, valor, data in historico.transacoes:
+            linhas.append(_LINHA_EXTRATO % (tipo, valor, datetime.datetime.fromtimestamp(data / 1e9).strftime(_FORMATO_DATA)))
+
+    linhas.append(f"\nSaldo:\t\tR$ {conta.saldo:.2f}")
+    linhas.append("==========================================\n")
+    _relatar("\n".join(linhas), end="")
+    return True
+
+
+def validar_novo_cliente(cpf, clientes):
+    """Confere se o CPF é válido e ainda não está cadastrado."""
+    if not validar_cpf(cpf): # Nova validação de CPF
+        _relatar("\n@@@ Operação falhou: CPF inválido! Verifique o formato e os dígitos. @@@")
+        return False
+
+    cliente_existente = filtrar_cliente(cpf, clientes)
+    if cliente_existente:
+        _relatar("\n@@@ Operação falhou: Já existe cliente com este CPF! @@@")
+        return False
+
+    return True
+
+
+def executar_criacao_usuario(clientes, cpf, nome, data_nascimento, endereco):
+    if not validar_novo_cliente(cpf, clientes):
+        return False
+
+    try:
+        datetime.datetime.strptime(data_nascimento, "%d-%m-%Y")
+    except ValueError:
+        _relatar("\n@@@ Operação falhou: Formato de data de nascimento inválido. Use dd-mm-aaaa. @@@")
+        return False
+
+    cliente = PessoaFisica(nome=nome, data_nascimento=data_nascimento, cpf=cpf, endereco=endereco)
+    clientes[cliente.cpf] = cliente
+
+    _relatar("\n=== Cliente criado com sucesso! ===")
+    return True
+
+
+def executar_criacao_conta(numeros_conta, cliente, contas):
+    # Verificar se o cliente já possui uma conta (regra de negócio, se cada cliente pode ter apenas uma conta)
+    # if cliente.contas:
+    #     _relatar("\n@@@ Cliente já possui uma conta. Não é possível criar outra. @@@")
+    #     return False
+
+    # O número só é consumido quando a conta é de fato criada, sem deixar lacunas.
+    numero_conta = next(numeros_conta)
+    conta = ContaCorrente.nova_conta(cliente=cliente, numero=numero_conta)
+    contas.append(conta)
+    cliente.adicionar_conta(conta)
+
+    _relatar(f"\n=== Conta {numero_conta} criada com sucesso para {cliente.nome}! ===")
+    return True
+
 
 def depositar(clientes):
     cpf = input("Informe o CPF do cliente: ")
     cliente = filtrar_cliente(cpf, clientes)
 
     if not cliente:
-        print("\n@@@ Operação falhou: Cliente não encontrado! @@@")
+        _relatar("\n@@@ Operação falhou: Cliente não encontrado! @@@")
         return
 
     valor_str = input("Informe o valor do depósito: ")
     try:
         valor = float(valor_str)
     except ValueError:
-        print("\n@@@ Operação falhou: Valor inválido. Por favor, digite um número. @@@")
+        _relatar("\n@@@ Operação falhou: Valor inválido. Por favor, digite um número. @@@")
         return
 
-    transacao = Deposito(valor)
-
-    conta = recuperar_conta_cliente(cliente)
-    if not conta:
-        return # Mensagem já tratada em recuperar_conta_cliente
-
-    if cliente.realizar_transacao(conta, transacao):
-        print("\n=== Depósito realizado com sucesso! ===")
-    # As mensagens de erro para valor <= 0 já estão dentro de Conta.depositar
+    executar_deposito(cliente, valor)
 
 
 def sacar(clientes):
@@ -307,26 +470,17 @@ def sacar(clientes):
     cliente = filtrar_cliente(cpf, clientes)
 
     if not cliente:
-        print("\n@@@ Operação falhou: Cliente não encontrado! @@@")
+        _relatar("\n@@@ Operação falhou: Cliente não encontrado! @@@")
         return
 
     valor_str = input("Informe o valor do saque: ")
     try:
         valor = float(valor_str)
     except ValueError:
-        print("\n@@@ Operação falhou: Valor inválido. Por favor, digite um número. @@@")
+        _relatar("\n@@@ Operação falhou: Valor inválido. Por favor, digite um número. @@@")
         return
 
-    transacao = Saque(valor)
-
-    conta = recuperar_conta_cliente(cliente)
-    if not conta:
-        return # Mensagem já tratada em recuperar_conta_cliente
-
-    if cliente.realizar_transacao(conta, transacao):
-        print("\n=== Saque realizado com sucesso! ===")
-    # As mensagens de erro para saldo insuficiente, limite e saques excedidos
-    # já são tratadas dentro de Conta.sacar e ContaCorrente.sacar.
+    executar_saque(cliente, valor)
 
 
 def exibir_extrato(clientes):
@@ -334,131 +488,125 @@ def exibir_extrato(clientes):
     cliente = filtrar_cliente(cpf, clientes)
 
     if not cliente:
-        print("\n@@@ Operação falhou: Cliente não encontrado! @@@")
+        _relatar("\n@@@ Operação falhou: Cliente não encontrado! @@@")
         return
 
-    conta = recuperar_conta_cliente(cliente)
-    if not conta:
-        return # Mensagem já tratada em recuperar_conta_cliente
-
-    print("\n================ EXTRATO ================")
-    transacoes = conta.historico.transacoes
-
-    if not transacoes:
-        print("Não foram realizadas movimentações.")
-    else:
-        for transacao in transacoes:
-            print(f"{transacao['tipo']}:\tR$ {transacao['valor']:.2f} ({transacao['data']})")
-
-    print(f"\nSaldo:\t\tR$ {conta.saldo:.2f}")
-    print("==========================================")
+    executar_extrato(cliente)
 
 
 def criar_usuario(clientes):
     cpf = input("Informe o CPF (somente números): ")
 
-    if not validar_cpf(cpf): # Nova validação de CPF
-        print("\n@@@ Operação falhou: CPF inválido! Verifique o formato e os dígitos. @@@")
-        return
-
-    cliente_existente = filtrar_cliente(cpf, clientes)
-    if cliente_existente:
-        print("\n@@@ Operação falhou: Já existe cliente com este CPF! @@@")
+    # Valida o CPF antes de pedir os demais dados
+    if not validar_novo_cliente(cpf, clientes):
         return
 
     nome = input("Informe o nome completo: ")
     data_nascimento = input("Informe a data de nascimento (dd-mm-aaaa): ")
     endereco = input("Informe o endereço (logradouro, nro - bairro - cidade/sigla estado): ")
 
-    try:
-        datetime.datetime.strptime(data_nascimento, "%d-%m-%Y")
-    except ValueError:
-        print("\n@@@ Operação falhou: Formato de data de nascimento inválido. Use dd-mm-aaaa. @@@")
-        return
-
-    cliente = PessoaFisica(nome=nome, data_nascimento=data_nascimento, cpf=cpf, endereco=endereco)
-    clientes.append(cliente)
+    executar_criacao_usuario(clientes, cpf, nome, data_nascimento, endereco)
 
-    print("\n=== Cliente criado com sucesso! ===")
 
-
-def criar_conta(numero_conta, clientes, contas):
+def criar_conta(numeros_conta, clientes, contas):
     cpf = input("Informe o CPF do cliente: ")
     cliente = filtrar_cliente(cpf, clientes)
 
     if not cliente:
-        print("\n@@@ Operação falhou: Cliente não encontrado! Favor criar o usuário primeiro. @@@") # Mensagem mais clara
-        return
+        _relatar("\n@@@ Operação falhou: Cliente não encontrado! Favor criar o usuário primeiro. @@@") # Mensagem mais clara
+        return False
 
     # O sistema permite múltiplos clientes com o mesmo CPF caso a validação acima seja ignorada ou desativada,
     # mas o filtrar_cliente filtra por CPF, então sempre pegará o primeiro.
     # O ideal seria garantir que o CPF é único na criação do usuário.
 
-    # Verificar se o cliente já possui uma conta (regra de negócio, se cada cliente pode ter apenas uma conta)
-    # if cliente.contas:
-    #     print("\n@@@ Cliente já possui uma conta. Não é possível criar outra. @@@")
-    #     return
-
-    conta = ContaCorrente.nova_conta(cliente=cliente, numero=numero_conta)
-    contas.append(conta)
-    cliente.adicionar_conta(conta)
-
-    print(f"\n=== Conta {numero_conta} criada com sucesso para {cliente.nome}! ===")
+    return executar_criacao_conta(numeros_conta, cliente, contas)
 
 
 def listar_contas(contas):
     if not contas:
-        print("\n@@@ Nenhuma conta cadastrada. @@@")
+        _relatar("\n@@@ Nenhuma conta cadastrada. @@@")
         return
 
+    # Monta a listagem inteira e escreve de uma só vez
+    partes = []
     for conta in contas:
-        print("=" * 100)
-        print(str(conta))
-    print("=" * 100)
+        partes.append(_SEPARADOR)
+        partes.append(str(conta)) # Chama o método __str__ da ContaCorrente
+    partes.append(_SEPARADOR + "\n")
+    _relatar("\n".join(partes), end="")
 
 
-# ==================== Função Principal ====================
-def main():
-    clientes = []
+# ==================== Execução em Lote ====================
+def executar_lote(eventos):
+    """
+    Executa uma sequência de operações sem interação com o usuário, útil para
+    reproduzir cenários e medir desempenho. Cada evento é uma tupla
+    (opcao, *argumentos), com as mesmas opções do menu:
+
+        ("nc", cpf, nome, data_nascimento, endereco)
+        ("nu", cpf)
+        ("d", cpf, valor) / ("s", cpf, valor)
+        ("e", cpf)
+        ("lc",)
+
+    Retorna os clientes (CPF -> Cliente) e as contas criadas.
+    """
+    clientes = {} # CPF -> Cliente
     contas = []
-    numero_conta = 1
+    numeros_conta = itertools.count(1)
 
-    while True:
-        opcao = menu()
+    def com_cliente(executar):
+        # Resolve o CPF do evento para o cliente antes de chamar a operação
+        def operacao(cpf, *argumentos):
+            cliente = filtrar_cliente(cpf, clientes)
+            if not cliente:
+                _relatar("\n@@@ Operação falhou: Cliente não encontrado! @@@")
+                return False
+            return executar(cliente, *argumentos)
+        return operacao
 
-        if opcao == "d":
-            depositar(clientes)
+    operacoes = {
+        "d": com_cliente(executar_deposito),
+        "s": com_cliente(executar_saque),
+        "e": com_cliente(executar_extrato),
+        "nc": lambda *argumentos: executar_criacao_usuario(clientes, *argumentos),
+        "nu": com_cliente(lambda cliente: executar_criacao_conta(numeros_conta, cliente, contas)),
+        "lc": lambda: listar_contas(contas),
+    }
 
-        elif opcao == "s":
-            sacar(clientes)
+    for opcao, *argumentos in eventos:
+        operacoes[opcao](*argumentos)
 
-        elif opcao == "e":
-            exibir_extrato(clientes)
+    return clientes, contas
 
-        elif opcao == "nc": # Novo usuário
-            criar_usuario(clientes)
 
-        elif opcao == "nu": # Nova conta
-            criar_conta(numero_conta, clientes, contas)
-            # Apenas incrementa o número da conta se a conta foi realmente criada.
-            # Se criar_conta falhar por CPF não encontrado, o numero_conta não deve avançar.
-            # Uma forma de lidar com isso é fazer criar_conta retornar um bool.
-            # Por simplicidade, vou considerar que o usuário vai criar o cliente antes.
-            # Se quiser mais robustez, pode ajustar assim:
-            # if criar_conta(numero_conta, clientes, contas):
-            #     numero_conta += 1
-            # (Mas isso implicaria mudar o print de sucesso para dentro da main ou o retorno)
-            # Por enquanto, deixamos como está com o incremento simples.
-            numero_conta += 1
+# ==================== Função Principal ====================
+def main():
+    clientes = {} # CPF -> Cliente
+    contas = []
+    numeros_conta = itertools.count(1)
+
+    operacoes = {
+        "d": lambda: depositar(clientes),
+        "s": lambda: sacar(clientes),
+        "e": lambda: exibir_extrato(clientes),
+        "nc": lambda: criar_usuario(clientes), # Novo usuário
+        "nu": lambda: criar_conta(numeros_conta, clientes, contas), # Nova conta
+        "lc": lambda: listar_contas(contas),
+    }
 
-        elif opcao == "lc":
-            listar_contas(contas)
+    while True:
+        opcao = menu()
 
-        elif opcao == "q":
+        if opcao == "q":
             break
 
+        operacao = operacoes.get(opcao)
+        if operacao:
+            operacao()
         else:
-            print("\n@@@ Operação inválida, por favor selecione novamente a operação desejada. @@@")
+            _relatar("\n@@@ Operação inválida, por favor selecione novamente a operação desejada. @@@")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file